@@ -1,8 +1,45 @@
 from abc import ABC, abstractmethod
+from math import factorial, perm
 
 import numpy as np
-from scipy.integrate import romb
-from scipy.interpolate import splev
+from numba import njit, prange
+from scipy.interpolate import BSpline as _SciBSpline
+from scipy.sparse import csr_matrix, issparse
+from scipy.special import poch
+
+
+def _accumulate_penalty(basis, x, w, q, tile=1024):
+    """Accumulate the weighted penalty cross product over quadrature points in tiles.
+
+    Evaluates the qth basis derivatives on successive tiles of the quadrature points and
+    adds each tile's weighted cross product into the :math:`K \\times K` accumulator, so the
+    full :math:`n \\times K` basis matrix over all quadrature points is never materialized.
+
+    Args:
+        basis (Basis): The basis system being integrated.
+
+        x (np.ndarray): Quadrature points.
+
+        w (np.ndarray): Quadrature weight of each point.
+
+        q (int): The order of the derivative of the basis functions in the integrand.
+
+        tile (int, Optional): Number of quadrature points evaluated per tile. Defaults to 1024.
+
+    Returns:
+        (np.ndarray): A :math:`K \\times K` matrix approximating
+            :math:`\\int B_k^{(q)}(t) B_l^{(q)}(t) dt` under the supplied quadrature rule.
+
+    """
+    inner_product = np.zeros((basis.K, basis.K))
+    for start in np.arange(0, x.size, tile):
+        phi_mat = basis._evaluate_basis(x[start:start + tile], q)
+        w_tile = w[start:start + tile]
+        if issparse(phi_mat):
+            inner_product += (phi_mat.T.multiply(w_tile) @ phi_mat).toarray()
+        else:
+            inner_product += (phi_mat.T * w_tile) @ phi_mat
+    return inner_product
 
 
 class Basis(ABC):
@@ -14,9 +51,13 @@ class Basis(ABC):
 
         K (int): The number of basis functions to use in the basis system.
 
+        dtype (np.dtype): The floating point type of evaluated basis matrices.
+
     """
 
-    def __init__(self, domain, K):
+    _cache_size = 8
+
+    def __init__(self, domain, K, dtype=np.float64):
         """Inits Basis class.
 
         Args:
@@ -24,9 +65,19 @@ class Basis(ABC):
 
             K (int): Number of basis functions to use in the basis system.
 
+            dtype (np.dtype, Optional): Floating point type of evaluated basis matrices. Defaults to np.float64;
+                np.float32 halves the memory traffic where downstream fitting tolerates reduced precision.
+
         """
         self.domain = domain
         self.K = K
+        self.dtype = dtype
+
+    def _invalidate_cache(self):
+        """Drop any cached evaluation results following a change to the basis parameters.
+
+        """
+        self._cache = {}
 
     @property
     def domain(self):
@@ -49,6 +100,7 @@ class Basis(ABC):
         if len(domain) != 2:
             raise ValueError("domain must be of length 2.")
         self.__domain = domain
+        self._invalidate_cache()
 
     @property
     def K(self):
@@ -67,6 +119,26 @@ class Basis(ABC):
 
         """
         self.__K = int(K)
+        self._invalidate_cache()
+
+    @property
+    def dtype(self):
+        """Getter for the dtype attribute."""
+        return self.__dtype
+
+    @dtype.setter
+    def dtype(self, dtype):
+        """Setter for the dtype attribute.
+
+        Args:
+            dtype (np.dtype): Floating point type of evaluated basis matrices.
+
+        Raises:
+            TypeError: If dtype cannot be interpreted as a numpy dtype.
+
+        """
+        self.__dtype = np.dtype(dtype)
+        self._invalidate_cache()
 
     @abstractmethod
     def _evaluate_basis(self, x, q):
@@ -99,10 +171,27 @@ class Basis(ABC):
         Raises:
             ValueError: If not all locations `x` lie in the domain of the basis system.
 
+        Notes:
+            Results for recently seen argument arrays are cached, so repeated calls with the same
+            locations (as in iterative fitting loops) return the stored matrix rather than
+            re-evaluating the basis. The cache is dropped whenever a basis parameter changes.
+            Returned matrices are marked read-only to protect the cache; copy before mutating.
+
         """
-        if not (np.all(np.less_equal(self.domain[0], x)) and np.all(np.less_equal(x, self.domain[1]))):
+        x = np.asarray(x, dtype=self.dtype)
+        if x.size and not (np.min(x) >= self.domain[0] and np.max(x) <= self.domain[1]):
             raise ValueError("Arguments must all be within the domain of the basis system")
-        basis_mat = self._evaluate_basis(x, q)
+        key = (q, x.shape, x.tobytes())
+        basis_mat = self._cache.get(key)
+        if basis_mat is None:
+            basis_mat = self._evaluate_basis(x, q)
+            if issparse(basis_mat):
+                basis_mat.data.flags.writeable = False
+            else:
+                basis_mat.flags.writeable = False
+            if len(self._cache) >= self._cache_size:
+                self._cache.pop(next(iter(self._cache)))
+            self._cache[key] = basis_mat
         return basis_mat
 
     @abstractmethod
@@ -122,7 +211,8 @@ class Basis(ABC):
         Args:
             q (int): The order of the derivative of the penalty matrix.
 
-            k (int, Optional): Number of samples for romberg integration calculated by :math:`2^k + 1`. Defaults to 12.
+            k (int, Optional): Number of samples for numerical integration calculated by :math:`2^k + 1`. Defaults
+                to 12.
 
         Returns:
             (np.ndarray): A :math:`K \\times K` matrix with elements given by :math:`p_{kl}`.
@@ -146,15 +236,49 @@ class Monomial(Basis):
 
     """
 
-    def __init__(self, domain, K):
+    def __init__(self, domain, K, dtype=np.float64):
         """Inits the Monomial class to represent the monomial basis system across the domain.
         Args:
             domain (tuple): The domain of the basis system specified by the lower and upper bound of the system.
 
             K (int): Number of basis functions to use in the basis system.
 
+            dtype (np.dtype, Optional): Floating point type of evaluated basis matrices. Defaults to np.float64.
+
+        """
+        super().__init__(domain, K, dtype)
+
+    @staticmethod
+    def _power_matrix(x, ncols):
+        """Build the matrix of monomials :math:`x^k` for :math:`k = 0, \\dots, ncols - 1`.
+
+        Columns are filled with an Estrin-style doubling scheme: once columns
+        :math:`0, \\dots, 2^j - 1` are known, the next block comes from one multiply of those
+        columns by :math:`x^{2^j}`. This needs only :math:`\\log_2 ncols` dependent steps
+        rather than a ``ncols``-long serial recurrence, leaving the multiplies within each
+        block free to execute independently.
+
+        Args:
+            x (np.ndarray): Locations to evaluate the monomials at.
+
+            ncols (int): Number of monomial columns to build.
+
+        Returns:
+            (np.ndarray): A :math:`n \\times ncols` matrix with :math:`k^\\text{th}` column :math:`x^k`.
+
         """
-        super().__init__(domain, K)
+        x = np.asarray(x)
+        power_mat = np.empty((x.size, ncols), dtype=x.dtype)
+        power_mat[:, 0] = 1.0
+        if ncols > 1:
+            power_mat[:, 1] = x
+        filled = 2
+        while filled < ncols:
+            block = min(filled, ncols - filled)
+            square = power_mat[:, filled // 2] ** 2
+            np.multiply(power_mat[:, :block], square[:, np.newaxis], out=power_mat[:, filled:filled + block])
+            filled *= 2
+        return power_mat
 
     def _evaluate_basis(self, x, q):
         """Evaluate the qth derivative of all basis functions at locations x for the Monomial basis system.
@@ -174,10 +298,14 @@ class Monomial(Basis):
 
         """
         deg = self.K
-        monomial_vecs = np.vander(x, N=deg, increasing=True)
-        if q != 0:
-            fac = [np.prod(range(f + 1 - q, f + 1)) if f > 0 else 0 for f in range(0, deg)]
-            monomial_vecs = fac * ((np.c_[np.ones((len(x), q)), monomial_vecs])[:, :-q])
+        if q == 0:
+            return self._power_matrix(x, deg)
+        if q >= deg:
+            return np.zeros((len(x), deg), dtype=self.dtype)
+        factors = np.array([perm(f, q) if f >= q else 0 for f in range(deg)], dtype=np.float64)
+        monomial_vecs = np.empty((len(x), deg), dtype=self.dtype)
+        monomial_vecs[:, :q] = 0.0
+        monomial_vecs[:, q:] = self._power_matrix(x, deg - q) * factors[q:]
         return monomial_vecs
 
     def penalty(self, q, k=12):
@@ -202,19 +330,11 @@ class Monomial(Basis):
             (np.ndarray): A :math:`K \\times K` matrix with elements given by :math:`p_{kl}`.
 
         """
-        inner_product = np.zeros((self.K, self.K))
-        for i in np.arange(q, self.K):
-            ifac = 1
-            for k in np.arange(1, q + 1):
-                ifac *= i - k + 1
-            for j in np.arange(i, self.K):
-                jfac = 1
-                for k in np.arange(1, q + 1):
-                    jfac *= j - k + 1
-                ipow = i + j - 2 * q + 1
-                inner_product[i, j] = (self.domain[1] ** ipow - self.domain[0] ** ipow) * ifac * jfac / ipow
-                inner_product[j, i] = inner_product[i, j]
-        return inner_product
+        factors = np.zeros(self.K)
+        factors[q:] = poch(np.arange(1, self.K - q + 1), q)
+        ipow = np.add.outer(np.arange(self.K), np.arange(self.K)) - 2 * q + 1
+        ipow = np.where(ipow > 0, ipow, 1)
+        return np.outer(factors, factors) * (self.domain[1] ** ipow - self.domain[0] ** ipow) / ipow
 
 
 class Exponential(Basis):
@@ -232,11 +352,11 @@ class Exponential(Basis):
 
         K (int): Number of basis functions to use in the basis system.
 
-        theta (tuple): Rate parameters for each basis function.
+        theta (np.ndarray): Rate parameters for each basis function.
 
     """
 
-    def __init__(self, domain, K, theta=None):
+    def __init__(self, domain, K, theta=None, dtype=np.float64):
         """Inits the univariate exponential basis system.
 
         Args:
@@ -245,14 +365,11 @@ class Exponential(Basis):
             K (int): Number of basis functions to use in the basis system.
 
             theta (tuple, optional): Rate parameters for each basis function. Defaults to None.
+
+            dtype (np.dtype, Optional): Floating point type of evaluated basis matrices. Defaults to np.float64.
         """
-        super().__init__(domain, K)
-        if theta is not None:
-            if not (len(set(theta)) == len(theta) and len(theta) == self.K):
-                raise ValueError('theta must have unique values of length K')
-            self.theta = theta
-        else:
-            self.theta = tuple(np.arange(self.K))
+        super().__init__(domain, K, dtype)
+        self.theta = theta if theta is not None else np.arange(self.K)
 
     @property
     def theta(self):
@@ -267,6 +384,7 @@ class Exponential(Basis):
 
         Args:
             theta (tuple): Rate vector for the basis system. Must be of length K and have all unique elements.
+                Stored as a contiguous float64 array.
 
         Raises:
              ValueError if theta is not of length K and contains only unique elements.
@@ -274,7 +392,8 @@ class Exponential(Basis):
         """
         if not (len(set(theta)) == len(theta) and len(theta) == self.K):
             raise ValueError('theta must have unique values of length K')
-        self.__theta = theta
+        self.__theta = np.ascontiguousarray(theta, dtype=np.float64)
+        self._invalidate_cache()
 
     def _evaluate_basis(self, x, q):
         """Evaluate the qth derivative of all basis functions at locations x for the Exponential basis system.
@@ -293,8 +412,10 @@ class Exponential(Basis):
                 derivative of the :math:`k^\\text{th}` basis functions evaluated at locations `x` of length :math:`n`.
 
         """
-        expon_vecs = np.exp(np.outer(x, self.theta))
-        return np.power(self.theta, q) * expon_vecs if q != 0 else expon_vecs
+        expon_vecs = np.exp(np.outer(x, self.theta.astype(self.dtype, copy=False)))
+        if q != 0:
+            expon_vecs *= self.theta ** q
+        return expon_vecs
 
     def penalty(self, q, k=12):
         """Calculate the qth order penalty matrix for the basis system.
@@ -351,7 +472,7 @@ class Fourier(Basis):
 
     """
 
-    def __init__(self, domain, K, period=None):
+    def __init__(self, domain, K, period=None, dtype=np.float64):
         """Inits the fourier basis system.
 
         Args:
@@ -362,6 +483,8 @@ class Fourier(Basis):
             period: (float, Optional): The period of the periodic fourier functions. Defaults to the length of the
                 domain. Must be positive.
 
+            dtype (np.dtype, Optional): Floating point type of evaluated basis matrices. Defaults to np.float64.
+
         Raises:
             ValueError: If K is not odd or greater than one.
 
@@ -369,7 +492,7 @@ class Fourier(Basis):
 
         if not (K % 2 != 0 and K > 1):
             raise ValueError('K must be odd and greater than one.')
-        super().__init__(domain, K)
+        super().__init__(domain, K, dtype)
         self.period = period if period is not None else float(np.diff(self.domain))
 
     @property
@@ -395,6 +518,7 @@ class Fourier(Basis):
         if period <= 0:
             raise ValueError('Period must be positive')
         self.__period = period
+        self._invalidate_cache()
 
     def _evaluate_basis(self, x, q):
         """"Evaluate the qth derivative of all basis functions at locations x for the Fourier basis system.
@@ -411,18 +535,20 @@ class Fourier(Basis):
         """
 
         omega = 2 * np.pi / self.period
-        r = np.arange((self.K + 1) // 2)
-        c = np.exp(1j * np.outer(x, r * omega))
-        c *= np.outer(np.ones(len(x)), (-1) ** (q // 2) * (np.arange((self.K + 1) // 2) * omega) ** q)
+        x = np.asarray(x)
+        r = np.arange(1, (self.K + 1) // 2)
+        harmonics = np.exp(1j * np.outer(x, r * omega))
+        harmonics *= (-1) ** (q // 2) * (r * omega) ** q
+        B = np.empty((x.size, self.K), dtype=self.dtype)
+        B[:, 0] = (1.0 if q == 0 else 0.0) / np.sqrt(2)
         if q % 2 == 0:
-            B = np.concatenate([c.T[0].real[:, np.newaxis] / np.sqrt(2)] + [
-                np.concatenate([c[:, i].imag[:, np.newaxis], c[:, i].real[:, np.newaxis]], axis=-1) for i in
-                np.arange(1, c.shape[-1])], axis=-1)
+            B[:, 1::2] = harmonics.imag
+            B[:, 2::2] = harmonics.real
         else:
-            B = np.concatenate([c.T[0].real[:, np.newaxis] / np.sqrt(2)] + [
-                np.concatenate([c[:, i].real[:, np.newaxis], -1.0 * c[:, i].imag[:, np.newaxis]], axis=-1) for i in
-                np.arange(1, c.shape[-1])], axis=-1)
-        return B / np.sqrt(self.period / 2)
+            B[:, 1::2] = harmonics.real
+            B[:, 2::2] = -harmonics.imag
+        B /= np.sqrt(self.period / 2)
+        return B
 
     def penalty(self, q, k=12):
         """Calculate the qth order penalty matrix for the basis system.
@@ -436,13 +562,14 @@ class Fourier(Basis):
             p_{kl} = \int B_k^{(q)}(t) B_l^{(q)}(t)dt
 
         where :math:`B_k` is the :math:`k^\\text{th}` basis function. In the case where the period of the basis system
-        is equal to the length of the domain we can analytically calculate the above, otherwise we use an romberg
-        numerical approximation to the integral which is controlled by parameter ``k``.
+        is equal to the length of the domain we can analytically calculate the above, otherwise we use a composite
+        Simpson approximation to the integral which is controlled by parameter ``k``.
 
         Args:
             q (int): The order of the derivative of the penalty matrix.
 
-            k (int, Optional): Number of samples for romberg integration calculated by :math:`2^k + 1`. Defaults to 12.
+            k (int, Optional): Number of samples for Simpson integration calculated by :math:`2^k + 1`. Defaults
+                to 12.
 
         Returns:
             (np.ndarray): A :math:`K \\times K` matrix with elements given by :math:`p_{kl}`.
@@ -451,12 +578,11 @@ class Fourier(Basis):
         if not np.isclose(self.period, np.diff(self.domain)):
             x = np.linspace(*self.domain, 2 ** k + 1)
             dx = np.divide(np.diff(self.domain), 2 ** k)
-            phi_mat = self(x, q)
-            cross_phi_mat = np.einsum('ij, ik -> ijk', phi_mat, phi_mat)
-            integrals = []
-            for i in np.arange(self.K):
-                integrals.append([romb(y=cross_phi_mat[:, i, j], dx=dx, axis=0) for j in np.arange(self.K)])
-            inner_product = np.squeeze(np.stack(integrals))
+            w = np.full(x.size, 2.0)
+            w[1::2] = 4.0
+            w[0] = w[-1] = 1.0
+            w *= dx / 3.0
+            inner_product = _accumulate_penalty(self, x, w, q)
         else:
             omega = 2 * np.pi / self.period
             inner_prod_diag = np.zeros(self.K)
@@ -471,6 +597,134 @@ class Fourier(Basis):
         return inner_product
 
 
+@njit(cache=True)
+def _deboor_local(knots, p, q, span, xval, out):
+    """Fill ``out`` with the qth derivatives of the :math:`p + 1` B-spline basis functions
+    active on knot span ``span`` evaluated at ``xval``.
+
+    Runs the Cox-de Boor triangle up to degree :math:`p - q` on the local knot window,
+    then promotes to degree :math:`p` with one application of the derivative recurrence
+    per remaining degree. ``out`` must have length :math:`p + 1`.
+
+    """
+    d = p - q
+    out[0] = 1.0
+    for j in range(1, d + 1):
+        saved = 0.0
+        for r in range(j):
+            right = knots[span + r + 1] - xval
+            left = xval - knots[span + 1 - (j - r)]
+            temp = out[r] / (right + left)
+            out[r] = saved + right * temp
+            saved = left * temp
+        out[j] = saved
+    for k in range(1, q + 1):
+        g = d + k
+        for j in range(g, -1, -1):
+            acc = 0.0
+            if j >= 1:
+                den = knots[span + j] - knots[span - g + j]
+                if den != 0.0:
+                    acc += out[j - 1] / den
+            if j <= g - 1:
+                den = knots[span + j + 1] - knots[span - g + j + 1]
+                if den != 0.0:
+                    acc -= out[j] / den
+            out[j] = g * acc
+
+
+@njit(parallel=True, cache=True)
+def _evaluate_basis_nb(x, spans, knots, p, q, data):
+    """Evaluate the qth derivative of the B-spline basis functions at locations ``x``.
+
+    Only the :math:`p + 1` basis functions locally supported on each point's knot span
+    ``spans[n]`` are computed; their values are written into row ``n`` of the
+    preallocated :math:`n \\times (p + 1)` matrix ``data``. Together with ``spans`` this
+    describes the banded basis matrix.
+
+    """
+    for n in prange(x.shape[0]):
+        _deboor_local(knots, p, q, spans[n], x[n], data[n])
+
+
+_unrolled_kernels = {}
+
+
+def _unrolled_kernel(m):
+    """Return a jit-compiled B-spline evaluation kernel specialized to order ``m``.
+
+    The order is known when a :class:`Bspline` is constructed but a generic kernel must
+    still loop over ``m`` recursion levels per point. Here the de Boor triangle is emitted
+    as straight-line source with the loop bounds fixed at ``m``, compiled with numba, and
+    cached per order, so the inner recurrence is fully unrolled with no branches. Only the
+    value case (``q = 0``) is specialized; derivatives use the generic kernel.
+
+    Args:
+        m (int): The order of the B-spline basis functions.
+
+    Returns:
+        (callable): A compiled kernel with signature ``(x, spans, knots, data)`` matching
+            the banded layout of :func:`_evaluate_basis_nb`.
+
+    """
+    kernel = _unrolled_kernels.get(m)
+    if kernel is None:
+        p = m - 1
+        lines = ['def _evaluate_unrolled(x, spans, knots, data):',
+                 '    for n in prange(x.shape[0]):',
+                 '        xn = x[n]',
+                 '        span = spans[n]',
+                 '        b0 = 1.0']
+        for i in range(1, p + 1):
+            lines.append('        l{0} = xn - knots[span + {1}]'.format(i, 1 - i))
+            lines.append('        r{0} = knots[span + {1}] - xn'.format(i, i))
+        for j in range(1, p + 1):
+            lines.append('        saved = 0.0')
+            for r in range(j):
+                lines.append('        temp = b{0} / (r{1} + l{2})'.format(r, r + 1, j - r))
+                lines.append('        b{0} = saved + r{1} * temp'.format(r, r + 1))
+                lines.append('        saved = l{0} * temp'.format(j - r))
+            lines.append('        b{0} = saved'.format(j))
+        for j in range(p + 1):
+            lines.append('        data[n, {0}] = b{0}'.format(j))
+        namespace = {'prange': prange}
+        exec(compile('\n'.join(lines), '<bspline order {0} kernel>'.format(m), 'exec'), namespace)
+        kernel = njit(parallel=True)(namespace['_evaluate_unrolled'])
+        _unrolled_kernels[m] = kernel
+    return kernel
+
+
+@njit(parallel=True, cache=True)
+def _assemble_penalty_nb(knots, K, p, q, nodes, weights, upper):
+    """Assemble the upper triangle of the B-spline penalty matrix in parallel.
+
+    Threads split over the basis index ``i``; each accumulates the Gauss-Legendre
+    contributions of the spans supporting basis ``i`` into row ``i`` of ``upper``,
+    touching only the :math:`p + 1` overlapping columns :math:`j \\geq i` of the band.
+    Rows are thread-private so no synchronization is needed.
+
+    """
+    for i in prange(K):
+        vals = np.empty(p + 1)
+        for span in range(i, i + p + 1):
+            if span < p or span > K - 1:
+                continue
+            a = knots[span]
+            b = knots[span + 1]
+            if b <= a:
+                continue
+            half = 0.5 * (b - a)
+            mid = 0.5 * (a + b)
+            for g in range(nodes.shape[0]):
+                _deboor_local(knots, p, q, span, half * nodes[g] + mid, vals)
+                w = half * weights[g]
+                vi = vals[i - (span - p)]
+                for j in range(i, min(i + p + 1, K)):
+                    lj = j - (span - p)
+                    if lj <= p:
+                        upper[i, j] += w * vi * vals[lj]
+
+
 class Bspline(Basis):
     """Representation of the univariate fourier basis system.
 
@@ -488,7 +742,7 @@ class Bspline(Basis):
 
     """
 
-    def __init__(self, domain, K, order, knots=None):
+    def __init__(self, domain, K, order, knots=None, dtype=np.float64):
         """Init the Bspline basis system.
 
         Args:
@@ -501,8 +755,10 @@ class Bspline(Basis):
             knots (tuple, Optional): The full knot vector for the Bspline basis functions. Defaults to linearly spaced
                 knots over the domain.
 
+            dtype (np.dtype, Optional): Floating point type of evaluated basis matrices. Defaults to np.float64.
+
         """
-        super().__init__(domain, K)
+        super().__init__(domain, K, dtype)
         self.order = order
         self.knots = knots
 
@@ -522,6 +778,8 @@ class Bspline(Basis):
 
         """
         self.__order = int(order)
+        self._coeffs = None
+        self._invalidate_cache()
 
     @property
     def knots(self):
@@ -540,6 +798,8 @@ class Bspline(Basis):
         if knots is not None and len(knots) != self.K + 1 - self.order:
             raise ValueError("Knot vector isn't correct length")
         self.__knots = knots if knots is not None else self.default_knots()
+        self._coeffs = None
+        self._invalidate_cache()
 
     def default_knots(self):
         """Calculate default knot placement for B-spline basis system.
@@ -550,45 +810,144 @@ class Bspline(Basis):
         """
         L = self.K - self.order
         tau = np.linspace(*self.domain, L + 2)
-        return np.pad(tau, (self.order - 1, self.order - 1), 'edge')
+        pad = self.order - 1
+        knots = np.empty(tau.size + 2 * pad)
+        knots[:pad] = self.domain[0]
+        knots[pad:pad + tau.size] = tau
+        knots[pad + tau.size:] = self.domain[1]
+        return knots
+
+    def decompose(self):
+        """Decompose the B-spline basis into per-knot-span power-basis coefficients.
+
+        Each basis function restricted to a knot span is a polynomial of degree
+        ``order - 1``, so its coefficients in the local coordinate :math:`u = (x - a)/(b - a)`
+        of span :math:`[a, b)` can be computed once and reused. The coefficients are cached
+        on the instance and subsequent calls to the basis use Horner evaluation of the local
+        polynomials instead of the de Boor recursion, reducing the per-point cost from
+        :math:`O(p^2)` to :math:`O(p)`. The cache is dropped if the knots or order change.
+
+        Returns:
+            (np.ndarray): A ``(K - order + 1, order, order)`` array with entry ``[s, l, j]``
+                the coefficient of :math:`u^j` for the :math:`l^\\text{th}` basis function
+                active on the :math:`s^\\text{th}` knot span.
+
+        """
+        p = self.order - 1
+        knots = np.ascontiguousarray(self.knots, dtype=np.float64)
+        coeffs = np.zeros((self.K - p, p + 1, p + 1))
+        vals = np.empty(p + 1)
+        for span in np.arange(p, self.K):
+            width = knots[span + 1] - knots[span]
+            for j in np.arange(p + 1):
+                _deboor_local(knots, p, j, span, knots[span], vals)
+                coeffs[span - p, :, j] = vals * width ** j / factorial(j)
+        self._coeffs = coeffs
+        return coeffs
+
+    def _evaluate_decomposed(self, x, q):
+        """Evaluate the qth derivative of all basis functions at locations x using the cached
+        per-span power-basis coefficients produced by :meth:`decompose`.
+
+        Args:
+            x (np.ndarray): Locations to evaluate basis function at.
+
+            q (int): The order of the derivative to take of the basis functions.
+
+        Returns:
+            (scipy.sparse.csr_matrix): A :math:`n \\times K` matrix with :math:`k^\\text{th}` columns corresponding
+                to the qth derivative of the :math:`k^\\text{th}` basis functions evaluated at locations `x` of
+                length :math:`n`. Only the :math:`n \\cdot order` locally supported entries are stored.
+
+        """
+        p = self.order - 1
+        knots = np.asarray(self.knots, dtype=np.float64)
+        spans = self._find_spans(x, knots)
+        width = knots[spans + 1] - knots[spans]
+        u = (x - knots[spans]) / width
+        coeffs = self._coeffs[spans - p]
+        if q != 0:
+            coeffs = coeffs[:, :, q:] * poch(np.arange(1, p - q + 2), q)
+        u_powers = np.empty((x.size, coeffs.shape[-1]))
+        u_powers[:, 0] = 1.0
+        for k in np.arange(1, coeffs.shape[-1]):
+            np.multiply(u_powers[:, k - 1], u, out=u_powers[:, k])
+        vals = np.einsum('nlj,nj->nl', coeffs, u_powers)
+        if q != 0:
+            vals /= width[:, np.newaxis] ** q
+        return self._banded_to_csr(vals, spans)
 
-    def _bspline_basis_function(self, i, x, q):
-        """Compute the ith basis function for the bspline representation evaluated at positions x.
+    def _find_spans(self, x, knots):
+        """Locate the knot span of each point with one batched binary search.
 
         Args:
-            i (int): The basis function to evaluate.
+            x (np.ndarray): Locations to find the knot spans of.
+
+            knots (np.ndarray): The full knot vector as a float array.
+
+        Returns:
+            (np.ndarray): The knot span index of each point, clipped to the valid range
+                so the points at the domain boundaries fall in the adjacent nonempty spans.
 
-            x (array_like): The points to evaluate the basis function at.
+        """
+        return np.clip(np.searchsorted(knots, x, side='right') - 1, self.order - 1, self.K - 1)
+
+    def _banded_to_csr(self, data, spans):
+        """Assemble the banded basis evaluation into a sparse CSR matrix.
+
+        Args:
+            data (np.ndarray): A :math:`n \\times order` matrix with row ``n`` holding the
+                values of the basis functions active at the :math:`n^\\text{th}` point.
 
-            q (int): The derivative of the basis function to evaluate.
+            spans (np.ndarray): The knot span index of each point.
 
         Returns:
-             basis_eval (array_like): The derivative of the ith basis function evaluated at points x.
+            (scipy.sparse.csr_matrix): The :math:`n \\times K` basis matrix with
+                :math:`n \\cdot order` stored entries.
 
         """
-        c = np.zeros(self.K)
-        c[i] += 1
-        return splev(x, (self.knots, c, self.order - 1), der=q)
+        n, m = data.shape
+        indices = (spans[:, np.newaxis] - (m - 1) + np.arange(m)).ravel()
+        indptr = np.arange(0, (n + 1) * m, m)
+        return csr_matrix((data.ravel().astype(self.dtype, copy=False), indices, indptr), shape=(n, self.K))
 
     def _evaluate_basis(self, x, q):
         """"Evaluate the qth derivative of all basis functions at locations x for the B-spline basis system.
 
+        Values (``q = 0``) are delegated to scipy's compiled ``BSpline.design_matrix`` builder when
+        available; derivatives and older scipy versions use the local numba kernels.
+
         Args:
             x (np.ndarray): Locations to evaluate basis function at.
 
             q (int): The order of the derivative to take of the basis functions.
 
         Returns:
-            (np.ndarray): A :math:`n \\times K` matrix with :math:`k^\\text{th}` columns corresponding to the qth
-                derivative of the :math:`k^\\text{th}` basis functions evaluated at locations `x` of length :math:`n`.
+            (scipy.sparse.csr_matrix): A :math:`n \\times K` matrix with :math:`k^\\text{th}` columns corresponding
+                to the qth derivative of the :math:`k^\\text{th}` basis functions evaluated at locations `x` of
+                length :math:`n`. Only the :math:`n \\cdot order` locally supported entries are stored.
 
         Raises:
-            ValueError: If the order of derivative is greater than or equal to the order of the B-spline basis system.
+            ValueError: If the order of derivative is negative or greater than or equal to the order of the
+                B-spline basis system.
 
         """
-        if q >= self.order:
-            raise ValueError("The order of derivative must be less than the order of the B-spline system.")
-        return np.array([self._bspline_basis_function(i, x, q) for i in np.arange(self.K)]).T
+        if not 0 <= q < self.order:
+            raise ValueError("The order of derivative must be between zero and the order of the B-spline system.")
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        if self._coeffs is not None:
+            return self._evaluate_decomposed(x, q)
+        knots = np.ascontiguousarray(self.knots, dtype=np.float64)
+        if q == 0 and x.size and hasattr(_SciBSpline, 'design_matrix'):
+            design = csr_matrix(_SciBSpline.design_matrix(x, knots, self.order - 1))
+            return design.astype(self.dtype) if design.dtype != self.dtype else design
+        spans = self._find_spans(x, knots)
+        data = np.empty((x.size, self.order))
+        if q == 0:
+            _unrolled_kernel(self.order)(x, spans, knots, data)
+        else:
+            _evaluate_basis_nb(x, spans, knots, self.order - 1, q, data)
+        return self._banded_to_csr(data, spans)
 
     def penalty(self, q, k=12):
         """Calculate the qth order penalty matrix for the basis system.
@@ -601,30 +960,29 @@ class Bspline(Basis):
         .. math::
             p_{kl} = \int B_k^{(q)}(t) B_l^{(q)}(t)dt
 
-        where :math:`B_k` is the :math:`k^\\text{th}` basis function. In the case where the period of the basis system
-        is equal to the length of the domain we can analytically calculate the above, otherwise we use an romberg
-        numerical approximation to the integral which is controlled by parameter ``k``.
+        where :math:`B_k` is the :math:`k^\\text{th}` basis function. The integrand is a piecewise polynomial of
+        degree :math:`2(order - 1 - q)` so the integral is computed exactly with Gauss-Legendre quadrature of
+        :math:`order - q` points on each knot span.
 
         Args:
             q (int): The order of the derivative of the penalty matrix.
 
-            k (int, Optional): Number of samples for romberg integration calculated by :math:`2^k + 1`. Defaults to 12.
+            k (int, Optional): Unused; retained for interface compatibility. The span-wise quadrature is exact so
+                no sampling parameter is required. Defaults to 12.
 
         Returns:
             (np.ndarray): A :math:`K \\times K` matrix with elements given by :math:`p_{kl}`.
 
         Raises:
-            ValueError: If order of derivative for the penalty is greater than or equal to the order of the B-spline
-                basis functions.
+            ValueError: If order of derivative for the penalty is negative or greater than or equal to the order
+                of the B-spline basis functions.
 
         """
-        x = np.linspace(*self.domain, 2 ** k + 1)
-        dx = np.divide(np.diff(self.domain), 2 ** k)
-        phi_mat = self(x, q)
-        cross_phi_mat = np.einsum('ij, ik -> ijk', phi_mat, phi_mat)
-
-        integrals = []
-        for i in np.arange(self.K):
-            integrals.append([
-                romb(y=cross_phi_mat[:, i, j], dx=dx, axis=0) for j in np.arange(self.K)])
-        return np.squeeze(np.stack(integrals))
+        if not 0 <= q < self.order:
+            raise ValueError("The order of derivative must be between zero and the order of the B-spline system.")
+        p = self.order - 1
+        knots = np.ascontiguousarray(self.knots, dtype=np.float64)
+        nodes, weights = np.polynomial.legendre.leggauss(p - q + 1)
+        upper = np.zeros((self.K, self.K))
+        _assemble_penalty_nb(knots, self.K, p, q, nodes, weights, upper)
+        return upper + upper.T - np.diag(upper.diagonal())
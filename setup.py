@@ -22,10 +22,12 @@ setup(name='basis',
       author_email='J.Austin3@newcastle.ac.uk',
       packages=find_packages(include=['basis', 'basis.*']),
       install_requires=[
+          'numba',
           'numpy',
           'scipy'
       ],
       tests_require=['pytest',
+                     'numba',
                      'numpy',
                      'scipy'],
       include_package_data=True,
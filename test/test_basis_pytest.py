@@ -15,6 +15,16 @@ class TestMonomial:
             assert np.allclose(bs_eval[:, i], x ** i)
         assert np.allclose(bs_eval.shape, (len(x), K))
 
+    def test__evaluate_basis_high_derivative(self):
+        K = 3
+        x = np.linspace(0, 1, 5)
+        bs = Monomial((0, 1), K)
+        assert np.allclose(bs(x, K - 1)[:, -1], np.full(len(x), 2.0))
+        for q in (K, K + 1):
+            bs_eval = bs(x, q)
+            assert np.allclose(bs_eval.shape, (len(x), K))
+            assert np.allclose(bs_eval, np.zeros((len(x), K)))
+
     def test_penalty(self):
         K = 8
         bs = Monomial((0, 1), K)
@@ -25,6 +35,39 @@ class TestMonomial:
         assert np.allclose(P[3], np.array([0.0, 1.0, 1.5, 1.8, 2.0, 2.142857, 2.25, 7 / 3]))
 
 
+class TestDtype:
+    @pytest.mark.parametrize("make_basis", [
+        lambda dtype: Monomial((0, 1), 6, dtype=dtype),
+        lambda dtype: Exponential((0, 1), 4, dtype=dtype),
+        lambda dtype: Fourier((0, 1), 5, 1.0, dtype=dtype),
+        lambda dtype: Bspline((0, 1), 8, 3, dtype=dtype),
+    ])
+    def test__evaluate_basis_dtype(self, make_basis):
+        x = np.linspace(0, 1, 17)
+        bs_eval64 = make_basis(np.float64)(x)
+        bs_eval32 = make_basis(np.float32)(x)
+        if hasattr(bs_eval64, 'toarray'):
+            bs_eval64, bs_eval32 = bs_eval64.toarray(), bs_eval32.toarray()
+        assert bs_eval64.dtype == np.float64
+        assert bs_eval32.dtype == np.float32
+        assert np.allclose(bs_eval64, bs_eval32, atol=1e-4)
+
+
+class TestEmpty:
+    @pytest.mark.parametrize("bs", [
+        Monomial((0, 1), 6),
+        Exponential((0, 1), 4),
+        Fourier((0, 1), 5, 1.0),
+        Bspline((0, 1), 8, 3),
+    ])
+    def test__evaluate_basis_empty(self, bs):
+        for q in (0, 1):
+            bs_eval = bs(np.array([]), q)
+            if hasattr(bs_eval, 'toarray'):
+                bs_eval = bs_eval.toarray()
+            assert bs_eval.shape == (0, bs.K)
+
+
 class TestExponential:
     def test_theta(self):
         K = 6
@@ -123,9 +166,29 @@ class TestBspline:
     def test__evaluate_basis(self):
         bs = Bspline((-1, 1), 8, order=3)
         x = np.linspace(-1, 1, 9)
-        assert np.allclose(bs(x)[:, 2], np.array([0, 0.28125, 0.75, 0.28125, 0, 0, 0, 0, 0]))
+        bs_eval = bs(x)
+        assert bs_eval.nnz == len(x) * bs.order
+        assert np.allclose(bs_eval.toarray()[:, 2], np.array([0, 0.28125, 0.75, 0.28125, 0, 0, 0, 0, 0]))
+        with pytest.raises(ValueError):
+            bs(x, -1)
+        with pytest.raises(ValueError):
+            bs(x, bs.order)
+
+    def test_decompose(self):
+        bs = Bspline((-1, 1), 8, order=4)
+        bs_dec = Bspline((-1, 1), 8, order=4)
+        bs_dec.decompose()
+        x = np.linspace(-1, 1, 33)
+        for q in np.arange(bs.order):
+            assert np.allclose(bs_dec(x, q).toarray(), bs(x, q).toarray())
+        bs_dec.order = 4
+        assert bs_dec._coeffs is None
 
     def test_penalty(self):
         bs = Bspline((-1, 1), 8, order=4)
         assert np.allclose(bs.penalty(2)[:, 2], np.array([54.6875, -105.46875, 70.3125, -20.83333333,
                                                           -1.302083, 2.604167, 0, 0]), atol=1e-2)
+        with pytest.raises(ValueError):
+            bs.penalty(-1)
+        with pytest.raises(ValueError):
+            bs.penalty(bs.order)